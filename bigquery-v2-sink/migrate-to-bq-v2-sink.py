@@ -1,18 +1,76 @@
 import argparse
 import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import io
 import json
-from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import getpass
+
+# Prefer orjson when available: it parses/serializes JSON several times
+# faster than the stdlib and works directly on bytes. Fall back to stdlib
+# json so the tool keeps working without the optional dependency.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dumps_compact(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+    def _dumps_compact(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Single pooled session so all calls to the Confluent control plane reuse
+# one keep-alive TCP+TLS connection instead of handshaking per request.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+_session.headers.update({'Accept': 'application/json'})
+
 auth_token = None
-last_poll_time = datetime.now()
-SCRUBBED_PASSWORD_STRING = "****************"
+# Interned so the scrub check can short-circuit on identity before falling
+# back to a character compare
+SCRUBBED_PASSWORD_STRING = sys.intern("****************")
+# Secret-valued keys that are collected elsewhere (the keyfile has its own
+# dedicated flow) and must be skipped by the generic scrubbed-value pass
+_SECRET_SKIP_KEYS = frozenset({"keyfile"})
+# Accepted affirmative answers for yes/no prompts
+_YES_ANSWERS = frozenset({'yes', 'y'})
+# V1 auto.update.schemas values mapped to their V2 equivalents
+_AUTO_UPDATE_MAP = MappingProxyType({"true": "ADD NEW FIELDS", "false": "DISABLED"})
+# Partitioning types that require the timestamp-partition follow-up prompts
+_PARTITIONED_TYPES = frozenset({"PARTITION by INGESTION TIME", "PARTITION by FIELD"})
 user_email = None
 user_password = None
 cloud_api_key = None
 cloud_api_secret = None
 is_api_key_auth = False
 
+# Horizontal rules used by the banners and section headers, built once
+_H80 = "=" * 80
+_S80 = "-" * 80
+_H60 = "=" * 60
+_H50 = "=" * 50
+
 class APIError(Exception):
     """Custom exception for API errors."""
     def __init__(self, message, status_code=None, response_text=None):
@@ -20,80 +78,144 @@ class APIError(Exception):
         self.status_code = status_code
         self.response_text = response_text
 
-# Define the mapping between BigQuery Legacy and Storage Write API configurations
-legacy_to_storage_mapping = {
-    "keyfile": "keyfile",
-    "project": "project",
-    "datasets": "datasets",
-    "topics": "topics",
-    "tasks.max": "tasks.max",
-    "sanitize.topics": "sanitize.topics",
-    "sanitize.field.names": "sanitize.field.names",
-    "auto.update.schemas": "auto.update.schemas",
-    "input.data.format": "input.data.format",
-    "input.key.format": "input.key.format",
-    "table.name.format": "topic2table.map",
-    "bigquery.retry.count": "bigQueryRetry",
-    "bigquery.thread.pool.size": "threadPoolSize",
-    "buffer.count.records": "queueSize"
-}
+# Error template bound once so the failure path formats without rebuilding
+# the f-string machinery per use
+_API_ERR_FMT = "Encountered Error: {e}, Status Code: {code}, Response: {body}\n".format
+
+# True defaults from the Storage Write API connector template; these are
+# configs that have a default_value in config_defs and are not handled by
+# user input.
+_APPLY_DEFAULTS = MappingProxyType({
+    'input.key.format': 'BYTES',
+    'sanitize.topics': 'true',
+    'sanitize.field.names': 'false',
+    'auto.update.schemas': 'DISABLED',
+    'topic2table.map': '',
+    'topic2clustering.fields.map': '',
+})
 
 # Default values for Storage Write API connector configurations
-storage_defaults = {
+storage_defaults = MappingProxyType({
     "sanitize.field.names": "false",
     "sanitize.field.names.in.array": "false",
     "auto.update.schemas": "DISABLED"
-}
-
-# Common configurations that should be preserved
-common_configs = [
-    "kafka.api.key",
-    "kafka.api.secret",
-    "kafka.service.account.id",
-    "kafka.auth.mode",
-    "kafka.endpoint",
-    "kafka.region",
-    "schema.registry.url",
-    "schema.registry.basic.auth.user.info",
-    "max.poll.interval.ms",
-    "max.poll.records",
-    "cloud.environment",
-    "cloud.provider"
-]
+})
 
 # Breaking changes warnings
-BREAKING_CHANGES = {
+BREAKING_CHANGES = MappingProxyType({
     "TIMESTAMP": "TIMESTAMP values are now interpreted as microseconds since epoch instead of seconds. This may cause data to be written to incorrect time periods.",
     "DATE": "DATE fields now support INT values in range -719162 to 2932896, which was not supported in Legacy API.",
     "DATETIME_FORMAT": "DATE, TIME, DATETIME, TIMESTAMP fields now support only a subset of the datetime canonical format that was supported in Legacy API.",
     "DATA_TYPES": "Storage Write API has different data type support compared to Legacy InsertAll API. Some data types may not be compatible.",
     "INT8, INT16": "INT8 and INT16 fields are now cast to FLOAT type in BigQuery. You can choose to cast them to INTEGER instead in next steps."
-}
+})
+
+# Pre-joined warning banner so each display is a single stdout write
+_BREAKING_CHANGES_BANNER = "\n".join([
+    "",
+    _H80,
+    "⚠️  IMPORTANT: BREAKING API CHANGES",
+    _H80,
+    "The BigQuery Storage Write API has breaking changes from the Legacy InsertAll API:",
+    "",
+    *[f"• {change_type}: {description}" for change_type, description in BREAKING_CHANGES.items()],
+    "",
+    _S80,
+    "RECOMMENDATIONS:",
+    "1. Test the migration with a small dataset first",
+    "2. Verify data integrity after migration",
+    "3. Review documentation: https://docs.confluent.io/cloud/current/connectors/cc-gcp-bigquery-storage-sink.html#legacy-to-v2-connector-migration",
+    _S80,
+]) + "\n"
+
+# Static prompt menus, pre-joined once so each display is a single write
+_CREDENTIALS_MENU = "\n".join([
+    "",
+    _H60,
+    "🔐 Confluent Cloud Credentials",
+    _H60,
+    "Choose how you want to provide your credentials:",
+    "1. Environment variables - Set EMAIL and PASSWORD environment variables",
+    "2. File - Provide path to a JSON file containing credentials (RECOMMENDED)",
+    "3. Secure input - Enter credentials manually (password hidden)",
+    "4. Cloud API Key - Use a Confluent Cloud API Key and Secret",
+    "",
+    "SECURITY NOTE: Option 2 (file) is recommended to avoid credential exposure in command history.",
+]) + "\n"
+
+_INGESTION_MODE_MENU = "\n".join([
+    "",
+    "📊 Ingestion Mode Selection:",
+    "1. STREAMING - Lower latency, higher cost",
+    "2. BATCH LOADING - Higher latency, lower cost",
+    "3. UPSERT - For upsert operations",
+    "4. UPSERT_DELETE - For upsert and delete operations",
+]) + "\n"
+
+_AUTO_CREATE_TABLES_MENU = "\n".join([
+    "",
+    "🏗️  Auto Create Tables Configuration:",
+    "1. DISABLED - Disable auto table creation (tables must exist beforehand)",
+    "2. NON-PARTITIONED - Creates tables without partitioning",
+    "3. PARTITION by INGESTION TIME - Creates tables partitioned by ingestion time",
+    "4. PARTITION by FIELD - Creates tables partitioned by a specific timestamp field",
+]) + "\n"
+
+_PARTITIONING_TYPE_MENU = "\n".join([
+    "",
+    _H50,
+    "⏰ Partitioning Type Configuration",
+    _H50,
+    "Choose the time partitioning type for your tables:",
+    "",
+    "1. HOUR - Partition by hour",
+    "2. DAY - Partition by day",
+    "3. MONTH - Partition by month",
+    "4. YEAR - Partition by year",
+    "",
+]) + "\n"
+
+# Static success banner, written with a single stdout call at the end of a run
+_SUCCESS_BANNER = "\n".join([
+    "",
+    _H80,
+    "✅ MIGRATION COMPLETED SUCCESSFULLY",
+    _H80,
+    "Next steps:",
+    "1. Verify the new connector is running properly",
+    "2. Check data integrity in BigQuery",
+    "3. Monitor for any data type related issues",
+    _H80,
+]) + "\n"
 
 # Configurations not supported in V2 Storage Write API connector
-UNSUPPORTED_CONFIGS = {
+UNSUPPORTED_CONFIGS = MappingProxyType({
     "allow.schema.unionization": "Schema unionization is not supported in V2 connector. This functionality is now part of the auto.update.schemas property, which handles schema evolution for both primitive and complex types (structs and arrays).",
     "all.bq.fields.nullable": "All BigQuery fields nullable setting is not supported in V2 connector. This controlled whether all fields were made nullable.",
     "convert.double.special.values": "Double special values conversion is not supported in V2 connector. This handled +Infinity, -Infinity, and NaN conversions.",
     "allow.bigquery.required.field.relaxation": "BigQuery required field relaxation is not supported in V2 connector. This allowed relaxing required field constraints."
-}
+})
+
+# Frozen sets for O(1) membership checks in the transform hot path
+_UNSUPPORTED_SET = frozenset(UNSUPPORTED_CONFIGS)
+_RESERVED_KEYS = frozenset(["name", "connector.class", "tasks.max", "authentication.method", "auto.update.schemas"])
 
 
 
+def _ask(prompt):
+    """Read one line from stdin, skipping input()'s readline machinery."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
 def get_credentials_input():
     """Handle credentials input with file support."""
-    print("\n" + "="*60)
-    print("🔐 Confluent Cloud Credentials")
-    print("="*60)
-    print("Choose how you want to provide your credentials:")
-    print("1. Environment variables - Set EMAIL and PASSWORD environment variables")
-    print("2. File - Provide path to a JSON file containing credentials (RECOMMENDED)")
-    print("3. Secure input - Enter credentials manually (password hidden)")
-    print("4. Cloud API Key - Use a Confluent Cloud API Key and Secret")
-    print()
-    print("SECURITY NOTE: Option 2 (file) is recommended to avoid credential exposure in command history.")
+    sys.stdout.write(_CREDENTIALS_MENU)
 
-    cred_choice = input("Choose option (1-4, default is 2): ").strip()
+    cred_choice = _ask("Choose option (1-4, default is 2): ").strip()
 
 
     global is_api_key_auth
@@ -105,7 +227,7 @@ def get_credentials_input():
         print("  Confluent Cloud UI → Administration → API Keys → Add API key")
         print()
 
-        api_key = input("Enter your Cloud API Key: ").strip()
+        api_key = _ask("Enter your Cloud API Key: ").strip()
         api_secret = getpass.getpass("Enter your Cloud API Secret (input hidden): ").strip()
 
         if not api_key or not api_secret:
@@ -117,11 +239,11 @@ def get_credentials_input():
     elif cred_choice == "2":
         # Option 2: File (RECOMMENDED)
         while True:
-            cred_file_path = input("Enter the path to your credentials JSON file: ").strip()
+            cred_file_path = _ask("Enter the path to your credentials JSON file: ").strip()
             if cred_file_path and os.path.exists(cred_file_path):
                 try:
-                    with open(cred_file_path, 'r') as f:
-                        cred_data = json.load(f)
+                    with open(cred_file_path, 'rb') as f:
+                        cred_data = _loads(f.read())
 
                     email = cred_data.get('email')
                     password = cred_data.get('password')
@@ -138,23 +260,23 @@ def get_credentials_input():
                         return api_key, api_secret
                     else:
                         print("❌ Invalid credentials file format. Expected: {\"email\": \"...\", \"password\": \"...\"}")
-                        retry = input("Try again? (yes/no): ").strip().lower()
-                        if retry not in ['yes', 'y']:
+                        retry = _ask("Try again? (yes/no): ").strip().lower()
+                        if retry not in _YES_ANSWERS:
                             return get_credentials_secure_input()
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     print(f"❌ Invalid JSON format in credentials file: {e}")
-                    retry = input("Try again? (yes/no): ").strip().lower()
-                    if retry not in ['yes', 'y']:
+                    retry = _ask("Try again? (yes/no): ").strip().lower()
+                    if retry not in _YES_ANSWERS:
                         return get_credentials_secure_input()
                 except Exception as e:
                     print(f"❌ Error reading credentials file: {e}")
-                    retry = input("Try again? (yes/no): ").strip().lower()
-                    if retry not in ['yes', 'y']:
+                    retry = _ask("Try again? (yes/no): ").strip().lower()
+                    if retry not in _YES_ANSWERS:
                         return get_credentials_secure_input()
             else:
                 print("❌ File not found. Please provide a valid file path.")
-                retry = input("Try again? (yes/no): ").strip().lower()
-                if retry not in ['yes', 'y']:
+                retry = _ask("Try again? (yes/no): ").strip().lower()
+                if retry not in _YES_ANSWERS:
                     return get_credentials_secure_input()
     elif cred_choice == "3":
         # Option 3: Secure input
@@ -178,51 +300,75 @@ def get_credentials_secure_input():
     print("\n📝 Secure Credentials Input")
     print("Your password will be hidden when typing.")
 
-    email = input("Enter your Confluent Cloud email: ").strip()
+    # Iterative retry: recursing here grew a stack frame per bad attempt
+    while True:
+        email = _ask("Enter your Confluent Cloud email: ").strip()
 
-    # Use getpass for secure password input (hidden)
-    password = getpass.getpass("Enter your Confluent Cloud password: ")
+        # Use getpass for secure password input (hidden)
+        password = getpass.getpass("Enter your Confluent Cloud password: ")
 
-    if email and password:
-        print("✅ Credentials received securely")
-        return email, password
-    else:
+        if email and password:
+            print("✅ Credentials received securely")
+            return email, password
         print("❌ Email and password cannot be empty")
-        return get_credentials_secure_input()
 
 def show_breaking_changes_warning():
     """Display breaking changes warning to the user."""
-    print("\n" + "="*80)
-    print("⚠️  IMPORTANT: BREAKING API CHANGES")
-    print("="*80)
-    print("The BigQuery Storage Write API has breaking changes from the Legacy InsertAll API:")
-    print()
-
-    for change_type, description in BREAKING_CHANGES.items():
-        print(f"• {change_type}: {description}")
+    sys.stdout.write(_BREAKING_CHANGES_BANNER)
+    sys.stdout.flush()
 
-    print("\n" + "-"*80)
-    print("RECOMMENDATIONS:")
-    print("1. Test the migration with a small dataset first")
-    print("2. Verify data integrity after migration")
-    print("3. Review documentation: https://docs.confluent.io/cloud/current/connectors/cc-gcp-bigquery-storage-sink.html#legacy-to-v2-connector-migration")
-    print("-"*80)
-
-    user_input = input("\nDo you understand these breaking changes and want to proceed? (yes/no): ")
+    user_input = _ask("\nDo you understand these breaking changes and want to proceed? (yes/no): ")
     if user_input.lower() != 'yes':
         print("Migration cancelled due to breaking changes concerns.")
         return False
     return True
 
+# Immutable result of get_user_inputs; attribute access through the tuple
+# slots is cheaper than repeated dict probing in main
+UserInputs = namedtuple('UserInputs', [
+    'new_connector_name',
+    'ingestion_mode',
+    'use_integer_for_int8_int16',
+    'commit_interval',
+    'auto_create_tables',
+    'partitioning_type',
+    'timestamp_partition_field_name',
+    'topic2table_map',
+    'project_for_migration',
+    'dataset_for_migration',
+    'use_date_time_formatter',
+])
+
+def _prompt_choice(prompt, options, default_key):
+    """Prompt for a numbered menu choice; unrecognized input selects the default."""
+    choice = _ask(prompt).strip()
+    return options.get(choice, options[default_key])
+
+def _prompt_int(prompt, lo, hi, default):
+    """Prompt for an integer within [lo, hi]; empty input selects the default."""
+    while True:
+        raw = _ask(prompt).strip()
+        if not raw:
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            print("❌ Invalid input. Please enter a valid number.")
+            continue
+        if lo <= value <= hi:
+            return value
+        print(f"❌ Invalid value: {value}")
+        print(f"   Value must be between {lo} and {hi}. Please try again.")
+
 def get_user_inputs(legacy_config):
     """Get user inputs for new connector configuration."""
-    print("\n" + "="*60)
+    print("\n" + _H60)
     print("MIGRATION CONFIGURATION")
-    print("="*60)
+    print(_H60)
 
     # Get new connector name
     while True:
-        new_connector_name = input(f"\nEnter new connector name (default: {legacy_config['name']}-v2): ").strip()
+        new_connector_name = _ask(f"\nEnter new connector name (default: {legacy_config['name']}-v2): ").strip()
         if not new_connector_name:
             new_connector_name = f"{legacy_config['name']}-v2"
         if new_connector_name != legacy_config['name']:
@@ -231,23 +377,14 @@ def get_user_inputs(legacy_config):
             print("❌ New connector name must be different from the legacy connector name.")
 
     # Get ingestion mode with numbered options
-    print("\n📊 Ingestion Mode Selection:")
-    print("1. STREAMING - Lower latency, higher cost")
-    print("2. BATCH LOADING - Higher latency, lower cost")
-    print("3. UPSERT - For upsert operations")
-    print("4. UPSERT_DELETE - For upsert and delete operations")
-
-    mode_choice = input("Choose ingestion mode (1-4, default is 1 for STREAMING): ").strip()
-    if mode_choice == "2":
-        ingestion_mode = "BATCH LOADING"
-    elif mode_choice == "3":
-        ingestion_mode = "UPSERT"
-        print("DISCLAIMER: For UPSERT mode, the records must have key fields.")
-    elif mode_choice == "4":
-        ingestion_mode = "UPSERT_DELETE"
-        print("DISCLAIMER: For UPSERT_DELETE mode, the records must have key fields.")
-    else:
-        ingestion_mode = "STREAMING"
+    sys.stdout.write(_INGESTION_MODE_MENU)
+
+    ingestion_mode = _prompt_choice(
+        "Choose ingestion mode (1-4, default is 1 for STREAMING): ",
+        {"1": "STREAMING", "2": "BATCH LOADING", "3": "UPSERT", "4": "UPSERT_DELETE"},
+        "1")
+    if ingestion_mode in ("UPSERT", "UPSERT_DELETE"):
+        print(f"DISCLAIMER: For {ingestion_mode} mode, the records must have key fields.")
 
     # Get Int8/Int16 type casting preference
     print("\n🔢 Int8/Int16 Type Casting:")
@@ -255,8 +392,8 @@ def get_user_inputs(legacy_config):
     print("by default cast to FLOAT type in BigQuery. You can choose to cast them to INTEGER instead.")
     print("This affects both auto table creation and schema updates.")
 
-    int_casting_choice = input("Do you want INT8 and INT16 fields to be cast to INTEGER instead of FLOAT? (yes/no, default is no): ").strip().lower()
-    if int_casting_choice in ['yes', 'y']:
+    int_casting_choice = _ask("Do you want INT8 and INT16 fields to be cast to INTEGER instead of FLOAT? (yes/no, default is no): ").strip().lower()
+    if int_casting_choice in _YES_ANSWERS:
         use_integer_for_int8_int16 = "true"
         print("INT8 and INT16 fields will be cast to INTEGER type.")
     else:
@@ -266,9 +403,9 @@ def get_user_inputs(legacy_config):
     # Get commit interval (only for BATCH LOADING)
     commit_interval = "60"  # Default from template
     if ingestion_mode == "BATCH LOADING":
-        print("\n" + "="*60)
+        print("\n" + _H60)
         print("⏱️  Commit Interval Configuration")
-        print("="*60)
+        print(_H60)
         print("For BATCH LOADING mode, you need to set a commit interval.")
         print("This is the interval (in seconds) when the connector attempts to commit streamed records.")
         print("⚠️  IMPORTANT: On every commit interval, a task calls the CreateWriteStream API")
@@ -277,97 +414,42 @@ def get_user_inputs(legacy_config):
         print("Valid range: 60 seconds (1 minute) to 14,400 seconds (4 hours)")
         print()
 
-        while True:
-            try:
-                commit_interval_input = input("Enter commit interval in seconds (default is 60): ").strip()
-
-                if not commit_interval_input:
-                    commit_interval = "60"
-                    print("Using default commit interval: 60 seconds (1 minute)")
-                    break
-
-                interval = int(commit_interval_input)
-
-                if 60 <= interval <= 14400:
-                    commit_interval = str(interval)
-                    print(f"✅ Commit interval set to: {commit_interval} seconds")
-                    break
-                else:
-                    print(f"❌ Invalid value: {interval}")
-                    print("   Commit interval must be between 60 and 14,400 seconds")
-                    print("   Please try again.")
-
-            except ValueError:
-                print("❌ Invalid input. Please enter a valid number.")
-                print("   Example: 60 for 1 minute, 300 for 5 minutes")
+        commit_interval = str(_prompt_int("Enter commit interval in seconds (default is 60): ", 60, 14400, 60))
+        print(f"✅ Commit interval set to: {commit_interval} seconds")
 
     # Get auto-create tables preference with numbered options (changed default to DISABLED)
-    print("\n🏗️  Auto Create Tables Configuration:")
-    print("1. DISABLED - Disable auto table creation (tables must exist beforehand)")
-    print("2. NON-PARTITIONED - Creates tables without partitioning")
-    print("3. PARTITION by INGESTION TIME - Creates tables partitioned by ingestion time")
-    print("4. PARTITION by FIELD - Creates tables partitioned by a specific timestamp field")
-
-    auto_create_choice = input("Choose auto create tables option (1-4, default is 1 for DISABLED): ").strip()
-    if auto_create_choice == "2":
-        auto_create_tables = "NON-PARTITIONED"
-        print("✅ Auto create tables set to: NON-PARTITIONED")
-    elif auto_create_choice == "3":
-        auto_create_tables = "PARTITION by INGESTION TIME"
-        print("✅ Auto create tables set to: PARTITION by INGESTION TIME")
-    elif auto_create_choice == "4":
-        auto_create_tables = "PARTITION by FIELD"
-        print("✅ Auto create tables set to: PARTITION by FIELD")
-    else:
-        auto_create_tables = "DISABLED"
-        print("✅ Auto create tables set to: DISABLED (default)")
+    sys.stdout.write(_AUTO_CREATE_TABLES_MENU)
+
+    auto_create_tables = _prompt_choice(
+        "Choose auto create tables option (1-4, default is 1 for DISABLED): ",
+        {"1": "DISABLED", "2": "NON-PARTITIONED", "3": "PARTITION by INGESTION TIME", "4": "PARTITION by FIELD"},
+        "1")
+    print(f"✅ Auto create tables set to: {auto_create_tables}")
 
     # Get partitioning options if auto-create tables is enabled
     partitioning_type = "DAY"  # Default from template
     timestamp_partition_field_name = ""
 
-    if auto_create_tables in ["PARTITION by INGESTION TIME", "PARTITION by FIELD"]:
-        print("\n" + "="*50)
-        print("⏰ Partitioning Type Configuration")
-        print("="*50)
-        print("Choose the time partitioning type for your tables:")
-        print()
-        print("1. HOUR - Partition by hour")
-        print("2. DAY - Partition by day")
-        print("3. MONTH - Partition by month")
-        print("4. YEAR - Partition by year")
-        print()
+    if auto_create_tables in _PARTITIONED_TYPES:
+        sys.stdout.write(_PARTITIONING_TYPE_MENU)
 
-        while True:
-            partition_choice = input("Choose partitioning type (1-4, default is 2): ").strip()
-            if partition_choice == "1":
-                partitioning_type = "HOUR"
-                print("✅ Partitioning type set to: HOUR")
-                break
-            elif partition_choice == "3":
-                partitioning_type = "MONTH"
-                print("✅ Partitioning type set to: MONTH")
-                break
-            elif partition_choice == "4":
-                partitioning_type = "YEAR"
-                print("✅ Partitioning type set to: YEAR")
-                break
-            else:
-                partitioning_type = "DAY"
-                print("✅ Partitioning type set to: DAY (default)")
-                break
+        partitioning_type = _prompt_choice(
+            "Choose partitioning type (1-4, default is 2): ",
+            {"1": "HOUR", "2": "DAY", "3": "MONTH", "4": "YEAR"},
+            "2")
+        print(f"✅ Partitioning type set to: {partitioning_type}")
 
         if auto_create_tables == "PARTITION by FIELD":
-            print("\n" + "="*50)
+            print("\n" + _H50)
             print("📅 Timestamp Partition Field Configuration")
-            print("="*50)
+            print(_H50)
             print("You selected 'PARTITION by FIELD' which requires specifying a timestamp field.")
             print("This field should contain the timestamp value used for partitioning.")
             print("Example field names: 'timestamp', 'created_at', 'event_time', etc.")
             print()
 
             while True:
-                timestamp_field = input("Enter the timestamp field name for partitioning: ").strip()
+                timestamp_field = _ask("Enter the timestamp field name for partitioning: ").strip()
                 if timestamp_field:
                     timestamp_partition_field_name = timestamp_field
                     print(f"✅ Timestamp partition field set to: {timestamp_field}")
@@ -376,9 +458,9 @@ def get_user_inputs(legacy_config):
                     print("❌ Field name cannot be empty. Please try again.")
 
     # Get testing configuration for project, dataset, and topic2table mapping
-    print("\n" + "="*60)
+    print("\n" + _H60)
     print("🧪 Testing Configuration")
-    print("="*60)
+    print(_H60)
     print("For testing purposes, you can configure project, dataset, and topic2table mapping")
     print("to write to different BigQuery resources. This allows you to test the migration")
     print("without affecting your production BigQuery tables.")
@@ -395,25 +477,25 @@ def get_user_inputs(legacy_config):
     print(f"• Topic2Table Map: {existing_topic2table_map if existing_topic2table_map else '(not configured)'}")
     print()
 
-    testing_choice = input("Do you want to update project, dataset, or topic2table mapping for testing? (yes/no, default is no): ").strip().lower()
+    testing_choice = _ask("Do you want to update project, dataset, or topic2table mapping for testing? (yes/no, default is no): ").strip().lower()
 
     # Initialize with current values
     project_for_migration = current_project
     dataset_for_migration = current_dataset
     topic2table_map = existing_topic2table_map
 
-    if testing_choice in ['yes', 'y']:
-        print("\n" + "="*50)
+    if testing_choice in _YES_ANSWERS:
+        print("\n" + _H50)
         print("🔧 Testing Configuration Setup")
-        print("="*50)
+        print(_H50)
 
         # Project configuration
         print(f"\n📋 Current project: {current_project if current_project else '(not configured)'}")
-        project_update = input("Do you want to update the project for testing? (yes/no): ").strip().lower()
+        project_update = _ask("Do you want to update the project for testing? (yes/no): ").strip().lower()
 
-        if project_update in ['yes', 'y']:
+        if project_update in _YES_ANSWERS:
             while True:
-                new_project = input("Enter new project ID for testing: ").strip()
+                new_project = _ask("Enter new project ID for testing: ").strip()
                 if new_project:
                     project_for_migration = new_project
                     print(f"✅ Project set to: {new_project}")
@@ -425,11 +507,11 @@ def get_user_inputs(legacy_config):
 
         # Dataset configuration
         print(f"\n📋 Current dataset: {current_dataset if current_dataset else '(not configured)'}")
-        dataset_update = input("Do you want to update the dataset for testing? (yes/no): ").strip().lower()
+        dataset_update = _ask("Do you want to update the dataset for testing? (yes/no): ").strip().lower()
 
-        if dataset_update in ['yes', 'y']:
+        if dataset_update in _YES_ANSWERS:
             while True:
-                new_dataset = input("Enter new dataset name for testing: ").strip()
+                new_dataset = _ask("Enter new dataset name for testing: ").strip()
                 if new_dataset:
                     dataset_for_migration = new_dataset
                     print(f"✅ Dataset set to: {new_dataset}")
@@ -441,16 +523,16 @@ def get_user_inputs(legacy_config):
 
         # Topic2Table mapping configuration
         print(f"\n📋 Current topic2table mapping: {existing_topic2table_map if existing_topic2table_map else '(not configured)'}")
-        topic2table_update = input("Do you want to update the topic2table mapping for testing? (yes/no): ").strip().lower()
+        topic2table_update = _ask("Do you want to update the topic2table mapping for testing? (yes/no): ").strip().lower()
 
-        if topic2table_update in ['yes', 'y']:
+        if topic2table_update in _YES_ANSWERS:
             print("\n📝 Topic to Table Mapping Input")
             print("Enter the mapping in format: topic1:table1,topic2:table2")
             print("Example: my-topic:my-test-table,another-topic:another-test-table")
             print("This will redirect data to test tables instead of production tables.")
 
             while True:
-                new_topic2table_map = input("Enter topic2table mapping: ").strip()
+                new_topic2table_map = _ask("Enter topic2table mapping: ").strip()
                 if new_topic2table_map:
                     topic2table_map = new_topic2table_map
                     print(f"✅ Topic to table mapping set to: {new_topic2table_map}")
@@ -460,21 +542,21 @@ def get_user_inputs(legacy_config):
         else:
             print(f"✅ Using existing topic2table mapping: {existing_topic2table_map}")
 
-        print("\n" + "="*50)
+        print("\n" + _H50)
         print("✅ Testing Configuration Summary")
-        print("="*50)
+        print(_H50)
         print(f"• Project: {project_for_migration}")
         print(f"• Dataset: {dataset_for_migration}")
         print(f"• Topic2Table Map: {topic2table_map}")
-        print("="*50)
+        print(_H50)
     else:
         print("✅ Using existing configurations for all settings")
 
     # Check if auto-create tables is disabled and provide table creation guidance
     if auto_create_tables == "DISABLED":
-        print("\n" + "="*60)
+        print("\n" + _H60)
         print("🏗️  Table Creation Guidance")
-        print("="*60)
+        print(_H60)
         print("Auto-create tables is set to DISABLED. You may need to create tables manually.")
         print()
         print("If you need to create tables with the same schema as existing tables, use:")
@@ -482,12 +564,12 @@ def get_user_inputs(legacy_config):
         print("LIKE `project-id.dataset-name.source_table_name`;")
         print()
         print("Replace with your actual project ID, dataset name, and table names.")
-        print("="*60)
+        print(_H60)
 
     # Get date time formatter preference
-    print("\n" + "="*50)
+    print("\n" + _H50)
     print("📅 Date Time Formatter Configuration")
-    print("="*50)
+    print(_H50)
     print("The 'use.date.time.formatter' setting controls how timestamp values are processed:")
     print()
     print("• FALSE (default) - Uses SimpleDateFormat for timestamp parsing")
@@ -497,52 +579,40 @@ def get_user_inputs(legacy_config):
     print("Note: The output might vary between the two formatters for the same input.")
     print()
 
-    date_formatter_choice = input("Do you want to use DateTimeFormatter? (yes/no, default is no): ").strip().lower()
-    if date_formatter_choice in ['yes', 'y']:
+    date_formatter_choice = _ask("Do you want to use DateTimeFormatter? (yes/no, default is no): ").strip().lower()
+    if date_formatter_choice in _YES_ANSWERS:
         use_date_time_formatter = "true"
         print("✅ DateTimeFormatter will be used for timestamp processing.")
     else:
         use_date_time_formatter = "false"
         print("✅ SimpleDateFormat will be used for timestamp processing (default).")
 
-    return {
-        'new_connector_name': new_connector_name,
-        'ingestion_mode': ingestion_mode,
-        'use_integer_for_int8_int16': use_integer_for_int8_int16,
-        'commit_interval': commit_interval,
-        'auto_create_tables': auto_create_tables,
-        'partitioning_type': partitioning_type,
-        'timestamp_partition_field_name': timestamp_partition_field_name,
-        'topic2table_map': topic2table_map,
-        'project_for_migration': project_for_migration,
-        'dataset_for_migration': dataset_for_migration,
-        'use_date_time_formatter': use_date_time_formatter
-    }
+    return UserInputs(
+        new_connector_name=new_connector_name,
+        ingestion_mode=ingestion_mode,
+        use_integer_for_int8_int16=use_integer_for_int8_int16,
+        commit_interval=commit_interval,
+        auto_create_tables=auto_create_tables,
+        partitioning_type=partitioning_type,
+        timestamp_partition_field_name=timestamp_partition_field_name,
+        topic2table_map=topic2table_map,
+        project_for_migration=project_for_migration,
+        dataset_for_migration=dataset_for_migration,
+        use_date_time_formatter=use_date_time_formatter,
+    )
 
 def apply_defaults(new_config, user_inputs):
     """Apply default values for missing configurations."""
     print("\n🔧 Applying default values...")
 
-    # Apply only the true defaults from Storage Write API connector template
-    # These are configs that have default_value in config_defs and are not handled by user input
-    defaults = {
-        'input.key.format': 'BYTES',  # Default from template
-        'sanitize.topics': 'true',    # Default from template
-        'sanitize.field.names': 'false',  # Default from template
-        'auto.update.schemas': 'DISABLED',  # Default from template
-        'topic2table.map': '',  # Default from template
-        'topic2clustering.fields.map': '',  # Default from template
-    }
-
-    # Apply defaults only if not already set
-    for key, value in defaults.items():
-        if key not in new_config:
-            new_config[key] = value
+    # C-level key-view difference: usually empty for full configs, in which
+    # case no copying or per-key probing happens at all
+    for key in _APPLY_DEFAULTS.keys() - new_config.keys():
+        new_config[key] = _APPLY_DEFAULTS[key]
 
     # Set sanitize.field.names.in.array based on sanitize.field.names
-    if 'sanitize.field.names' in new_config:
-        sanitize_field_names = new_config['sanitize.field.names'].lower() == 'true'
-        new_config['sanitize.field.names.in.array'] = str(sanitize_field_names).lower()
+    sanitize_field_names = new_config['sanitize.field.names'].lower() == 'true'
+    new_config['sanitize.field.names.in.array'] = str(sanitize_field_names).lower()
 
     return new_config
 
@@ -555,101 +625,146 @@ def transform_legacy_to_storage(legacy_config):
         storage_config = {
             "connector.class": "BigQueryStorageSink",
             "tasks.max": legacy_config.get("tasks.max", 1),
+            # Legacy connector only supports service account authentication via keyfile
+            "authentication.method": "Google cloud service account",
         }
 
-        # Legacy connector only supports service account authentication via keyfile
-        if "keyfile" in legacy_config:
-            storage_config["authentication.method"] = "Google cloud service account"
-        else:
-            storage_config["authentication.method"] = "Google cloud service account"
-
-        # Map legacy configurations to Storage Write API configurations
-        config_mapping = {
-            "topics": "topics",
-            "project": "project",
-            "datasets": "datasets",
-            "keyfile": "keyfile",
-            "input.data.format": "input.data.format",
-            "sanitize.topics": "sanitize.topics",
-            "sanitize.field.names": "sanitize.field.names",
-            "topic2table.map": "topic2table.map",
-            "sanitize.field.names.in.array": "sanitize.field.names.in.array"
-        }
-
-        # Copy mapped configurations
-        for legacy_key, storage_key in config_mapping.items():
-            if legacy_key in legacy_config:
-                storage_config[storage_key] = legacy_config[legacy_key]
+        # Single pass over the legacy config: skip reserved and unsupported
+        # keys and copy everything else through under its own name. Every
+        # key the old per-call config_mapping dict renamed mapped to itself
+        # (topics, project, datasets, keyfile, ...), so no mapping table is
+        # needed at all — if the Storage connector ever renames a key, add a
+        # module-level mapping constant rather than a per-call dict here.
+        for config_key, config_value in legacy_config.items():
+            if config_key in _RESERVED_KEYS or config_key in _UNSUPPORTED_SET:
+                continue
+            storage_config[config_key] = config_value
 
         # Handle auto.update.schemas transformation from v1 to v2 format
         if "auto.update.schemas" in legacy_config:
             v1_value = legacy_config["auto.update.schemas"]
-            if v1_value.lower() == "true":
-                storage_config["auto.update.schemas"] = "ADD NEW FIELDS"
-                print(f"✅ Transformed auto.update.schemas: '{v1_value}' → 'ADD NEW FIELDS'")
-            elif v1_value.lower() == "false":
-                storage_config["auto.update.schemas"] = "DISABLED"
-                print(f"✅ Transformed auto.update.schemas: '{v1_value}' → 'DISABLED'")
-            else:
+            mapped = _AUTO_UPDATE_MAP.get(v1_value.lower())
+            if mapped is None:
                 # Handle unexpected values - default to DISABLED for safety
                 print(f"⚠️  Warning: Unexpected auto.update.schemas value '{v1_value}' in legacy config. Defaulting to 'DISABLED'.")
-                storage_config["auto.update.schemas"] = "DISABLED"
-
-        # Copy common configurations
-        for config_key in common_configs:
-            if config_key in legacy_config:
-                storage_config[config_key] = legacy_config[config_key]
-
-        # Copy additional configurations (excluding unsupported ones)
-        for config_key, config_value in legacy_config.items():
-            if (config_key not in config_mapping and
-                config_key not in common_configs and
-                config_key not in UNSUPPORTED_CONFIGS and
-                config_key not in ["name", "connector.class", "tasks.max", "authentication.method", "auto.update.schemas"]):
-                storage_config[config_key] = config_value
+                mapped = "DISABLED"
+            else:
+                print(f"✅ Transformed auto.update.schemas: '{v1_value}' → '{mapped}'")
+            storage_config["auto.update.schemas"] = mapped
 
-        # Apply storage defaults for missing configurations
-        for config_key, default_value in storage_defaults.items():
-            if config_key not in storage_config:
-                storage_config[config_key] = default_value
+        # Apply storage defaults for missing configurations (existing keys win)
+        for config_key in storage_defaults.keys() - storage_config.keys():
+            storage_config[config_key] = storage_defaults[config_key]
 
         return storage_config
 
     except Exception as e:
         raise Exception(f"Error transforming Legacy to Storage Write API configuration: {e}") from e
 
+def _load_and_validate_keyfile(keyfile_path):
+    """Load a keyfile from disk as bytes and validate it is JSON before use."""
+    content = Path(keyfile_path).read_bytes()
+    _loads(content)
+    return content.decode('utf-8')
+
 def get_keyfile_input():
     """Handle direct keyfile input with better support for large JSON content."""
-    print("\n📝 Direct Keyfile Input")
-    print("Paste your GCP service account JSON content below.")
-    print("Press Enter twice when finished:")
-
-    lines = []
     while True:
-        try:
-            line = input()
-            if line.strip() == "" and lines:  # Empty line after content
-                break
-            lines.append(line)
-        except EOFError:
-            break
-
-    keyfile_content = "\n".join(lines)
+        print("\n📝 Direct Keyfile Input")
+        print("Paste your GCP service account JSON content below.")
+        print("Press Enter twice when finished:")
+
+        if not sys.stdin.isatty():
+            # Piped input: one bulk read of raw bytes, decoded once, instead
+            # of a line-at-a-time loop rebuilding a string per line
+            keyfile_content = sys.stdin.buffer.read().decode('utf-8')
+        else:
+            # Interactive paste: read raw lines until a blank line follows content
+            lines = []
+            while True:
+                line = sys.stdin.readline()
+                if not line:  # EOF
+                    break
+                line = line.rstrip("\n")
+                if line.strip() == "" and lines:  # Empty line after content
+                    break
+                lines.append(line)
+            keyfile_content = "\n".join(lines)
 
-    # Validate that it's valid JSON
+        # Validate that it's valid JSON
+        try:
+            _loads(keyfile_content)
+            print("✅ Valid JSON keyfile content received")
+            return keyfile_content
+        except ValueError as e:
+            print(f"❌ Invalid JSON format: {e}")
+            retry = _ask("Try again? (yes/no): ").strip().lower()
+            if retry not in _YES_ANSWERS:
+                raise APIError("Invalid keyfile JSON format")
+
+def _json_or_raise(response, what):
+    """Decode a JSON response body, raising APIError on malformed payloads."""
     try:
-        json.loads(keyfile_content)
-        print("✅ Valid JSON keyfile content received")
-        return keyfile_content
-    except json.JSONDecodeError as e:
-        print(f"❌ Invalid JSON format: {e}")
-        retry = input("Try again? (yes/no): ").strip().lower()
-        if retry in ['yes', 'y']:
-            return get_keyfile_input()
-        else:
-            raise Exception("Invalid keyfile JSON format")
+        return _loads(response.content)
+    except ValueError:
+        raise APIError(f"Failed to decode JSON for {what}", response_text=response.text)
+
+# Auth tokens cached per base_url with a monotonic expiry; the TTL can be
+# tuned via AUTH_TOKEN_TTL_SECONDS. _TOKEN_SAFETY_MARGIN_SECONDS is shaved
+# off so a token is refreshed proactively rather than right at the
+# server-side 180s boundary, where an in-flight request could still lose
+# the race and pay a 401 + re-auth mid-batch.
+AUTH_TOKEN_TTL_SECONDS = float(os.environ.get("AUTH_TOKEN_TTL_SECONDS", 180))
+_TOKEN_SAFETY_MARGIN_SECONDS = 30
+_token_cache = {}
+
+# On-disk token cache so back-to-back CLI runs in a migration batch skip the
+# auth round-trip. Holds only the short-lived session token (never the
+# password), written with owner-only permissions. Disable with --no_cache.
+_TOKEN_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "confluent-migrate", "token.json")
+_use_disk_cache = True
+
+def _load_cached_token(base_url):
+    """Return a still-valid token for base_url from the disk cache, or None."""
+    try:
+        with open(_TOKEN_CACHE_PATH, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('base_url') != base_url:
+        return None
+    if cached.get('exp', 0) <= time.time() + 60:
+        return None
+    return cached.get('token')
+
+def _store_cached_token(base_url, token):
+    """Best-effort write of the session token to the disk cache."""
+    try:
+        os.makedirs(os.path.dirname(_TOKEN_CACHE_PATH), exist_ok=True)
+        with open(_TOKEN_CACHE_PATH, 'w') as f:
+            json.dump({'base_url': base_url,
+                       'token': token,
+                       'exp': time.time() + AUTH_TOKEN_TTL_SECONDS - _TOKEN_SAFETY_MARGIN_SECONDS}, f)
+        os.chmod(_TOKEN_CACHE_PATH, 0o600)
+    except OSError:
+        pass
 
 def get_auth_token(base_url, email=None, password=None):
+    cached = _token_cache.get(base_url)
+    if cached is not None:
+        token, expiry = cached
+        if time.monotonic() < expiry:
+            return token
+
+    if _use_disk_cache:
+        token = _load_cached_token(base_url)
+        if token:
+            _token_cache[base_url] = (token, time.monotonic() + 60)
+            _session.cookies.set('auth_token', token)
+            return token
+
     url = base_url + "api/sessions"
 
     if not email or not password:
@@ -664,37 +779,58 @@ def get_auth_token(base_url, email=None, password=None):
         'password': password
     }
 
-    response = requests.post(url, json=json_data)
+    response = _session.post(url, json=json_data, timeout=(5, 30))
 
     if not response.ok:
         raise APIError(f"Failed to get auth token: {response.status_code} {response.reason}",
                        status_code=response.status_code,
                        response_text=response.text)
 
-    try:
-        token = response.json().get('token')
-        if not token:
-            raise APIError("Auth token not found in response")
-        return token
-    except json.JSONDecodeError:
-        raise APIError("Failed to decode JSON while getting auth token", response_text=response.text)
+    token = _json_or_raise(response, "auth token").get('token')
+    if not token:
+        raise APIError("Auth token not found in response")
+    _token_cache[base_url] = (token, time.monotonic() + AUTH_TOKEN_TTL_SECONDS - _TOKEN_SAFETY_MARGIN_SECONDS)
+    _session.cookies.set('auth_token', token)
+    if _use_disk_cache:
+        _store_cached_token(base_url, token)
+    return token
+
+# URL templates bound once; each call site does a single .format instead of
+# rebuilding the two alternative f-string URLs inline.
+_URL_PUBLIC_CONNECTORS = "https://api.confluent.cloud/connect/v1/environments/{env}/clusters/{lkc}/connectors"
+_URL_INTERNAL_CONNECTORS = "{base}api/accounts/{env}/clusters/{lkc}/connectors"
+
+def _connectors_url(base_url, env, lkc, suffix=""):
+    """Build the connectors endpoint URL for the active auth mode."""
+    template = _URL_PUBLIC_CONNECTORS if is_api_key_auth else _URL_INTERNAL_CONNECTORS
+    return template.format(base=base_url, env=env, lkc=lkc) + suffix
 
 def make_api_request(method, url, base_url, **kwargs):
     """Make an authenticated API request. Handles token refresh for email/password auth."""
-    global auth_token, last_poll_time, user_email, user_password, cloud_api_key, cloud_api_secret, is_api_key_auth
+    global auth_token
+    kwargs.setdefault('timeout', (5, 30))
     if is_api_key_auth:
-        return requests.request(method, url, auth=(cloud_api_key, cloud_api_secret), **kwargs)
-    else:
-        if (datetime.now() - last_poll_time).total_seconds() > 180:
-            auth_token = get_auth_token(base_url, user_email, user_password)
-            last_poll_time = datetime.now()
-        return requests.request(method, url, cookies={'auth_token': auth_token}, **kwargs)
+        return _session.request(method, url, auth=(cloud_api_key, cloud_api_secret), **kwargs)
+    # get_auth_token memoizes per base_url and sets the session cookie, so
+    # this is a cache hit inside the TTL and needs no per-call cookie dict
+    auth_token = get_auth_token(base_url, user_email, user_password)
+    return _session.request(method, url, **kwargs)
+
+# Configs memoized per (env, lkc, connector_name) so validation/transform/
+# retry paths that re-read the same connector skip the network entirely.
+_config_cache = {}
+
+def invalidate_connector_config(env, lkc, connector_name):
+    """Drop the cached config for a connector after mutating remote state."""
+    _config_cache.pop((env, lkc, connector_name), None)
 
 def get_connector_config(base_url, env, lkc, connector_name):
     global is_api_key_auth
-    url = (f"https://api.confluent.cloud/connect/v1/environments/{env}/clusters/{lkc}/connectors/{connector_name}"
-           if is_api_key_auth else
-           f"{base_url}api/accounts/{env}/clusters/{lkc}/connectors/{connector_name}")
+    cache_key = (env, lkc, connector_name)
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+    url = _connectors_url(base_url, env, lkc, f"/{connector_name}")
     response = make_api_request('GET', url, base_url)
 
     if not response.ok:
@@ -702,56 +838,66 @@ def get_connector_config(base_url, env, lkc, connector_name):
                        status_code=response.status_code,
                        response_text=response.text)
 
-    try:
-        json_response = response.json()
-        return json_response["config"]
-    except json.JSONDecodeError:
-        raise APIError(f"Failed to decode JSON for connector config: {connector_name}", response_text=response.text)
+    config = _json_or_raise(response, f"connector config: {connector_name}")["config"]
+    # Store a copy so callers mutating the returned dict don't poison the cache
+    _config_cache[cache_key] = dict(config)
+    return config
 
 def get_connector_offsets(base_url, env, lkc, connector_name):
     global is_api_key_auth
-    url = (f"https://api.confluent.cloud/connect/v1/environments/{env}/clusters/{lkc}/connectors/{connector_name}/offsets"
-           if is_api_key_auth else
-           f"{base_url}api/accounts/{env}/clusters/{lkc}/connectors/{connector_name}/offsets")
-    response = make_api_request('GET', url, base_url)
+    url = _connectors_url(base_url, env, lkc, f"/{connector_name}/offsets")
+    # Offsets payloads can run to megabytes for high-partition connectors;
+    # stream the body and parse the raw bytes to skip the intermediate str copy.
+    response = make_api_request('GET', url, base_url, stream=True)
 
     if not response.ok:
         raise APIError(f"Failed to get connector offsets for {connector_name}: {response.status_code} {response.reason}",
                        status_code=response.status_code,
                        response_text=response.text)
 
+    with response:
+        body = response.raw.read(decode_content=True)
     try:
-        json_response = response.json()
-        return json_response["offsets"]
-    except json.JSONDecodeError:
-        raise APIError(f"Failed to decode JSON for connector offsets: {connector_name}", response_text=response.text)
+        return _loads(body)["offsets"]
+    except ValueError:
+        raise APIError(f"Failed to decode JSON for connector offsets: {connector_name}",
+                       response_text=body.decode('utf-8', 'replace'))
+
+def _preflight_create(base_url, payload):
+    """Warm the HTTPS connection and pre-serialize the create payload.
 
-def send_create_request(base_url, env, lkc, connector_name, configs, offsets):
+    Runs in a background thread while the user reviews the final config, so
+    the create POST costs roughly one round-trip once they confirm.
+    """
+    try:
+        _session.head(base_url, timeout=5)
+    except requests.RequestException:
+        pass
+    return _dumps_compact(payload)
+
+def send_create_request(base_url, env, lkc, connector_name, configs, offsets, body=None):
     global is_api_key_auth
     new_connector_name = configs.get("name")
-    json_data = {'name': new_connector_name, 'config': configs, 'offsets': offsets}
-    url = (f"https://api.confluent.cloud/connect/v1/environments/{env}/clusters/{lkc}/connectors"
-           if is_api_key_auth else
-           f"{base_url}api/accounts/{env}/clusters/{lkc}/connectors")
-    response = make_api_request('POST', url, base_url, json=json_data)
+    url = _connectors_url(base_url, env, lkc)
+    if body is None:
+        json_data = {'name': new_connector_name, 'config': configs, 'offsets': offsets}
+        response = make_api_request('POST', url, base_url, json=json_data)
+    else:
+        response = make_api_request('POST', url, base_url, data=body,
+                                    headers={'Content-Type': 'application/json'})
 
     if response.status_code != 201:
         raise APIError(f"Failed to create connector: {response.status_code} {response.reason}",
                        status_code=response.status_code,
                        response_text=response.text)
 
-    try:
-        json_response = response.json()
-        print(f"Connector '{new_connector_name}' created successfully. Response: {json.dumps(json_response, indent=2)}")
-        return json_response
-    except json.JSONDecodeError:
-        raise APIError(f"Failed to decode JSON response for connector creation", response_text=response.text)
+    json_response = _json_or_raise(response, "connector creation")
+    print(f"Connector '{new_connector_name}' created successfully. Response: {_dumps(json_response)}")
+    return json_response
 
 def get_connector_status(base_url, env, lkc, connector_name):
     global is_api_key_auth
-    url = (f"https://api.confluent.cloud/connect/v1/environments/{env}/clusters/{lkc}/connectors/{connector_name}/status"
-           if is_api_key_auth else
-           f"{base_url}api/accounts/{env}/clusters/{lkc}/connectors/{connector_name}/status")
+    url = _connectors_url(base_url, env, lkc, f"/{connector_name}/status")
     response = make_api_request('GET', url, base_url)
 
     if not response.ok:
@@ -759,30 +905,23 @@ def get_connector_status(base_url, env, lkc, connector_name):
                        status_code=response.status_code,
                        response_text=response.text)
 
-    try:
-        json_response = response.json()
-        return json_response["connector"]["state"]
-    except json.JSONDecodeError:
-        raise APIError(f"Failed to decode JSON for connector status: {connector_name}", response_text=response.text)
+    return _json_or_raise(response, f"connector status: {connector_name}")["connector"]["state"]
 
 def check_unsupported_configs(legacy_config):
     """Check for configurations that are not supported in V2 connector."""
-    found_unsupported = []
-
-    for config_key in UNSUPPORTED_CONFIGS.keys():
-        if config_key in legacy_config:
-            found_unsupported.append(config_key)
-
-    return found_unsupported
+    # Intersect in C, but report in UNSUPPORTED_CONFIGS definition order so
+    # the warning list is stable across runs.
+    present = _UNSUPPORTED_SET.intersection(legacy_config)
+    return [key for key in UNSUPPORTED_CONFIGS if key in present]
 
 def show_unsupported_configs_warning(unsupported_configs):
     """Display warning about unsupported configurations."""
     if not unsupported_configs:
         return True
 
-    print("\n" + "="*80)
+    print("\n" + _H80)
     print("⚠️  UNSUPPORTED CONFIGURATIONS DETECTED")
-    print("="*80)
+    print(_H80)
     print("The following configurations are NOT SUPPORTED in V2 connector:")
     print()
 
@@ -795,7 +934,7 @@ def show_unsupported_configs_warning(unsupported_configs):
     for config_key in unsupported_configs:
         print(f"• {config_key}: {UNSUPPORTED_CONFIGS[config_key]}")
 
-    print("\n" + "-"*80)
+    print("\n" + _S80)
     print("IMPACT: These configurations will be ignored during migration.")
 
     if has_schema_unionization:
@@ -811,31 +950,226 @@ def show_unsupported_configs_warning(unsupported_configs):
         print("All fields created through V2 connector are nullable by default.")
         print("The 'allow.bigquery.required.field.relaxation' configuration is no longer supported in V2 connector.")
 
-    print("-"*80)
+    print(_S80)
 
-    user_input = input("\nDo you understand that these configurations will not be migrated? (yes/no): ")
+    user_input = _ask("\nDo you understand that these configurations will not be migrated? (yes/no): ")
     if user_input.lower() != 'yes':
         print("Migration cancelled.")
         return False
     return True
 
+def migrate_connector(env, lkc, connector_name, secrets_file=None):
+    """Run the full migration flow for a single legacy connector.
+
+    Assumes credentials are already collected; the pooled session, auth
+    token and config caches are shared across calls so batch runs only
+    pay for TLS and auth once.
+    """
+    print("Fetching Legacy connector's status...", flush=True)
+    status = get_connector_status(base_url, env, lkc, connector_name)
+    print(f"Connector status for {connector_name}: {status}")
+
+    # Show status-based recommendations
+    if status == "RUNNING":
+        print("\n" + _H80)
+        print("⚠️  CONNECTOR STATUS WARNING")
+        print(_H80)
+        print("Your legacy connector is currently RUNNING.")
+        print()
+        print("• If you are testing on dummy tables, you can keep the existing connector running")
+        print("• For migrating production tables, it is recommended to pause the V1 connector")
+        print("  to avoid data duplication")
+        print()
+        print("The migration will proceed, but be aware of potential data duplication.")
+        print(_H80)
+    elif status == "PAUSED":
+        print("✅ Legacy connector is paused - safe to proceed with migration")
+    else:
+        print(f"ℹ️  Legacy connector status: {status}")
+
+    # Confluent Cloud has no batch endpoint for dependent operations, so
+    # the next best thing is issuing the two independent GETs in parallel
+    # over the pooled session instead of back to back.
+    print("Fetching legacy connector offsets and config...", flush=True)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        offsets_future = executor.submit(get_connector_offsets, base_url, env, lkc, connector_name)
+        legacy_config = get_connector_config(base_url, env, lkc, connector_name)
+        offsets = offsets_future.result()
+
+    # Check for unsupported configurations
+    print("Checking for unsupported configurations...")
+    unsupported_configs = check_unsupported_configs(legacy_config)
+    if not show_unsupported_configs_warning(unsupported_configs):
+        return
+
+    # Get user inputs for new connector configuration
+    user_inputs = get_user_inputs(legacy_config)
+
+    print("Transforming Legacy connector's config to Storage Write API...")
+    storage_config = transform_legacy_to_storage(legacy_config)
+
+    # Collect every user-driven override in one patch dict, then apply it
+    # with a single update; this is also one auditable block instead of a
+    # trail of field-by-field assignments
+    patch = {
+        'name': user_inputs.new_connector_name,
+        'ingestion.mode': user_inputs.ingestion_mode,
+        'use.integer.for.int8.int16': user_inputs.use_integer_for_int8_int16,
+        'use.date.time.formatter': user_inputs.use_date_time_formatter,
+        'auto.create.tables': user_inputs.auto_create_tables,
+    }
+    if user_inputs.ingestion_mode == 'BATCH LOADING':
+        patch['commit.interval'] = user_inputs.commit_interval
+    if user_inputs.auto_create_tables != 'DISABLED':
+        patch['partitioning.type'] = user_inputs.partitioning_type
+        if user_inputs.timestamp_partition_field_name:
+            patch['timestamp.partition.field.name'] = user_inputs.timestamp_partition_field_name
+    if user_inputs.topic2table_map:
+        patch['topic2table.map'] = user_inputs.topic2table_map
+    if user_inputs.project_for_migration:
+        patch['project'] = user_inputs.project_for_migration
+    if user_inputs.dataset_for_migration:
+        patch['datasets'] = user_inputs.dataset_for_migration
+    storage_config.update(patch)
+
+    # Apply default values from Storage Write API connector template
+    storage_config = apply_defaults(storage_config, user_inputs)
+
+    # Handle keyfile input specially for large JSON content
+    if "keyfile" in storage_config and storage_config["keyfile"] == SCRUBBED_PASSWORD_STRING:
+        print("\n" + _H60)
+        print("🔑 GCP Service Account Keyfile Input")
+        print(_H60)
+        print("Choose how you want to provide the keyfile:")
+        print("1. File path - Provide path to JSON file")
+        print("2. Environment variable - Set GCP_KEYFILE_PATH environment variable")
+        print("3. Direct input - Paste the JSON content directly")
+
+        keyfile_choice = _ask("Choose option (1-3, default is 1): ").strip()
+
+        if keyfile_choice == "2":
+            # Option 2: Environment variable
+            keyfile_path = os.environ.get("GCP_KEYFILE_PATH")
+            if keyfile_path and os.path.exists(keyfile_path):
+                try:
+                    storage_config["keyfile"] = _load_and_validate_keyfile(keyfile_path)
+                    print(f"✅ Keyfile loaded from environment variable: {keyfile_path}")
+                except Exception as e:
+                    print(f"❌ Error reading keyfile from {keyfile_path}: {e}")
+                    storage_config["keyfile"] = get_keyfile_input()
+            else:
+                print("❌ GCP_KEYFILE_PATH environment variable not set or file not found")
+                storage_config["keyfile"] = get_keyfile_input()
+        elif keyfile_choice == "3":
+            # Option 3: Direct input
+            storage_config["keyfile"] = get_keyfile_input()
+        else:
+            # Option 1: File path (default)
+            while True:
+                keyfile_path = _ask("Enter the path to your GCP service account JSON file: ").strip()
+                if keyfile_path and os.path.exists(keyfile_path):
+                    try:
+                        storage_config["keyfile"] = _load_and_validate_keyfile(keyfile_path)
+                        print(f"✅ Keyfile loaded successfully from: {keyfile_path}")
+                        break
+                    except Exception as e:
+                        print(f"❌ Error reading file: {e}")
+                        retry = _ask("Try again? (yes/no): ").strip().lower()
+                        if retry not in _YES_ANSWERS:
+                            storage_config["keyfile"] = get_keyfile_input()
+                            break
+                else:
+                    print("❌ File not found. Please provide a valid file path.")
+                    retry = _ask("Try again? (yes/no): ").strip().lower()
+                    if retry not in _YES_ANSWERS:
+                        storage_config["keyfile"] = get_keyfile_input()
+                        break
+
+    # Fill in the other fields with "****************" in two phases:
+    # collect the scrubbed keys first, satisfy them from the secrets file
+    # or MIGRATE_* environment variables, and only then prompt for the
+    # remainder in one block. Keyfile is handled above.
+    missing = [key for key, value in storage_config.items()
+               if value == SCRUBBED_PASSWORD_STRING and key not in _SECRET_SKIP_KEYS]
+    if missing:
+        secrets = {}
+        if secrets_file:
+            try:
+                with open(secrets_file, 'rb') as f:
+                    secrets = _loads(f.read())
+            except (OSError, ValueError) as e:
+                print(f"❌ Could not read secrets file {secrets_file}: {e}")
+        for key in list(missing):
+            value = secrets.get(key) or os.environ.get("MIGRATE_" + key.upper().replace('.', '_'))
+            if value:
+                storage_config[key] = value
+                missing.remove(key)
+    if missing:
+        print("\n🔑 Values are needed for the following sensitive fields:")
+        print("  " + ", ".join(missing))
+        for key in missing:
+            while True:
+                user_input = getpass.getpass(f"Please enter the value for {key}: ")
+                if user_input:
+                    storage_config[key] = user_input
+                    break
+                print("Input cannot be empty. Please try again.")
+
+    # Display the Storage Write API configuration and ask for confirmation
+    # Mask keyfile for display
+    display_config = storage_config.copy()
+    if 'keyfile' in display_config:
+        display_config['keyfile'] = '********'
+    banner = io.StringIO()
+    banner.write("\n" + _H80 + "\n")
+    banner.write("📋 FINAL STORAGE WRITE API CONNECTOR CONFIGURATION\n")
+    banner.write(_H80 + "\n")
+    banner.write(_dumps(display_config))
+    banner.write("\n" + _H80 + "\n")
+    sys.stdout.write(banner.getvalue())
+    sys.stdout.flush()
+
+    # Warm the connection and stage the POST body in the background
+    # while the user reads the configuration above.
+    payload = {'name': storage_config.get("name"), 'config': storage_config, 'offsets': offsets}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        preflight = executor.submit(_preflight_create, base_url, payload)
+        user_input = _ask("\nPlease review the above configuration. Do you want to proceed with creating the Storage Write API connector? (yes/no): ")
+        if user_input.lower() != 'yes':
+            print("Migration cancelled.")
+            return
+        body = preflight.result()
+
+    print("Creating Storage Write API connector...", flush=True)
+    send_create_request(base_url, env, lkc, user_inputs.new_connector_name, storage_config, offsets, body=body)
+
+    sys.stdout.write(_SUCCESS_BANNER)
+
 def main():
     parser = argparse.ArgumentParser(description="Migrate BigQuery V1 Legacy sink connector to BigQuery V2 Storage Write API Connector.")
-    parser.add_argument('--legacy_connector', required=True, help='Name of the Legacy connector')
+    parser.add_argument('--legacy_connector', required=True,
+                        help='Name of the Legacy connector (comma-separated for a batch)')
     parser.add_argument('--environment', required=True, help='Environment ID')
     parser.add_argument('--cluster_id', required=True, help='Cluster ID')
+    parser.add_argument('--secrets_file', help='Optional JSON file with values for scrubbed sensitive configs')
+    parser.add_argument('--no_cache', action='store_true', help='Do not reuse the cached auth token from disk')
     args = parser.parse_args()
 
-    connector_name = args.legacy_connector
+    connector_names = [name.strip() for name in args.legacy_connector.split(',') if name.strip()]
     env = args.environment
     lkc = args.cluster_id
 
+    global _use_disk_cache
+    _use_disk_cache = not args.no_cache
+
+    failures = []
     try:
         # Show breaking changes warning first
         if not show_breaking_changes_warning():
             return
 
-        # Get credentials after breaking changes warning
+        # Get credentials once; the session, auth token and caches below are
+        # shared across every connector in the batch
         print("🔐 Setting up Confluent Cloud authentication...")
         global user_email, user_password, auth_token, cloud_api_key, cloud_api_secret, is_api_key_auth
         cred1, cred2 = get_credentials_input()
@@ -846,175 +1180,28 @@ def main():
             user_email, user_password = cred1, cred2
             auth_token = get_auth_token(base_url, user_email, user_password)
 
-        print("Fetching Legacy connector's status...")
-        status = get_connector_status(base_url, env, lkc, connector_name)
-        print(f"Connector status for {connector_name}: {status}")
-
-        # Show status-based recommendations
-        if status == "RUNNING":
-            print("\n" + "="*80)
-            print("⚠️  CONNECTOR STATUS WARNING")
-            print("="*80)
-            print("Your legacy connector is currently RUNNING.")
-            print()
-            print("• If you are testing on dummy tables, you can keep the existing connector running")
-            print("• For migrating production tables, it is recommended to pause the V1 connector")
-            print("  to avoid data duplication")
-            print()
-            print("The migration will proceed, but be aware of potential data duplication.")
-            print("="*80)
-        elif status == "PAUSED":
-            print("✅ Legacy connector is paused - safe to proceed with migration")
-        else:
-            print(f"ℹ️  Legacy connector status: {status}")
-
-        print("Fetching legacy connector offsets...")
-        offsets = get_connector_offsets(base_url, env, lkc, connector_name)
-
-        print("Fetching Legacy connector's config...")
-        legacy_config = get_connector_config(base_url, env, lkc, connector_name)
-
-        # Check for unsupported configurations
-        print("Checking for unsupported configurations...")
-        unsupported_configs = check_unsupported_configs(legacy_config)
-        if not show_unsupported_configs_warning(unsupported_configs):
-            return
-
-        # Get user inputs for new connector configuration
-        user_inputs = get_user_inputs(legacy_config)
-
-        print("Transforming Legacy connector's config to Storage Write API...")
-        storage_config = transform_legacy_to_storage(legacy_config)
-
-        # Update connector name with user input
-        storage_config['name'] = user_inputs['new_connector_name']
-
-        # Apply user inputs to storage configuration
-        storage_config['ingestion.mode'] = user_inputs['ingestion_mode']
-        storage_config['use.integer.for.int8.int16'] = user_inputs['use_integer_for_int8_int16']
-        storage_config['use.date.time.formatter'] = user_inputs['use_date_time_formatter']
-
-        # Apply commit interval for BATCH LOADING mode
-        if user_inputs['ingestion_mode'] == 'BATCH LOADING':
-            storage_config['commit.interval'] = user_inputs['commit_interval']
-
-        # Apply auto-create tables and related configs
-        storage_config['auto.create.tables'] = user_inputs['auto_create_tables']
-        if user_inputs['auto_create_tables'] != 'DISABLED':
-            storage_config['partitioning.type'] = user_inputs['partitioning_type']
-            if user_inputs['timestamp_partition_field_name']:
-                storage_config['timestamp.partition.field.name'] = user_inputs['timestamp_partition_field_name']
-
-        # Apply topic2table.map configuration
-        if user_inputs['topic2table_map']:
-            storage_config['topic2table.map'] = user_inputs['topic2table_map']
-
-        # Apply project and dataset configuration
-        if user_inputs['project_for_migration']:
-            storage_config['project'] = user_inputs['project_for_migration']
-        if user_inputs['dataset_for_migration']:
-            storage_config['datasets'] = user_inputs['dataset_for_migration']
-
-        # Apply default values from Storage Write API connector template
-        storage_config = apply_defaults(storage_config, user_inputs)
-
-        # Handle keyfile input specially for large JSON content
-        if "keyfile" in storage_config and storage_config["keyfile"] == SCRUBBED_PASSWORD_STRING:
-            print("\n" + "="*60)
-            print("🔑 GCP Service Account Keyfile Input")
-            print("="*60)
-            print("Choose how you want to provide the keyfile:")
-            print("1. File path - Provide path to JSON file")
-            print("2. Environment variable - Set GCP_KEYFILE_PATH environment variable")
-            print("3. Direct input - Paste the JSON content directly")
-
-            keyfile_choice = input("Choose option (1-3, default is 1): ").strip()
-
-            if keyfile_choice == "2":
-                # Option 2: Environment variable
-                keyfile_path = os.environ.get("GCP_KEYFILE_PATH")
-                if keyfile_path and os.path.exists(keyfile_path):
-                    try:
-                        with open(keyfile_path, 'r') as f:
-                            storage_config["keyfile"] = f.read()
-                        print(f"✅ Keyfile loaded from environment variable: {keyfile_path}")
-                    except Exception as e:
-                        print(f"❌ Error reading keyfile from {keyfile_path}: {e}")
-                        storage_config["keyfile"] = get_keyfile_input()
-                else:
-                    print("❌ GCP_KEYFILE_PATH environment variable not set or file not found")
-                    storage_config["keyfile"] = get_keyfile_input()
-            elif keyfile_choice == "3":
-                # Option 3: Direct input
-                storage_config["keyfile"] = get_keyfile_input()
-            else:
-                # Option 1: File path (default)
-                while True:
-                    keyfile_path = input("Enter the path to your GCP service account JSON file: ").strip()
-                    if keyfile_path and os.path.exists(keyfile_path):
-                        try:
-                            with open(keyfile_path, 'r') as f:
-                                storage_config["keyfile"] = f.read()
-                            print(f"✅ Keyfile loaded successfully from: {keyfile_path}")
-                            break
-                        except Exception as e:
-                            print(f"❌ Error reading file: {e}")
-                            retry = input("Try again? (yes/no): ").strip().lower()
-                            if retry not in ['yes', 'y']:
-                                storage_config["keyfile"] = get_keyfile_input()
-                                break
-                    else:
-                        print("❌ File not found. Please provide a valid file path.")
-                        retry = input("Try again? (yes/no): ").strip().lower()
-                        if retry not in ['yes', 'y']:
-                            storage_config["keyfile"] = get_keyfile_input()
-                            break
-
-        # Prompt user to input values for other fields with "****************"
-        for key, value in storage_config.items():
-            if value == SCRUBBED_PASSWORD_STRING and key != "keyfile":  # Skip keyfile as it's handled above
-                while True:
-                    user_input = input(f"Please enter the value for {key}: ").strip()
-                    if user_input:
-                        storage_config[key] = user_input
-                        break
-                    else:
-                        print("Input cannot be empty. Please try again.")
-
-        # Display the Storage Write API configuration and ask for confirmation
-        print("\n" + "="*80)
-        print("📋 FINAL STORAGE WRITE API CONNECTOR CONFIGURATION")
-        print("="*80)
-        # Mask keyfile for display
-        display_config = storage_config.copy()
-        if 'keyfile' in display_config:
-            display_config['keyfile'] = '********'
-        print(json.dumps(display_config, indent=4))
-        print("="*80)
-
-        user_input = input("\nPlease review the above configuration. Do you want to proceed with creating the Storage Write API connector? (yes/no): ")
-        if user_input.lower() != 'yes':
-            print("Migration cancelled.")
-            return
-
-        print("Creating Storage Write API connector...")
-        send_create_request(base_url, env, lkc, user_inputs['new_connector_name'], storage_config, offsets)
+        for connector_name in connector_names:
+            if len(connector_names) > 1:
+                print(f"\n{_H80}\n🚚 Migrating connector: {connector_name}\n{_H80}")
+            try:
+                migrate_connector(env, lkc, connector_name, secrets_file=args.secrets_file)
+            except APIError as e:
+                if len(connector_names) == 1:
+                    raise
+                sys.stderr.write(_API_ERR_FMT(e=e, code=e.status_code, body=e.response_text))
+                failures.append(connector_name)
 
-        print("\n" + "="*80)
-        print("✅ MIGRATION COMPLETED SUCCESSFULLY")
-        print("="*80)
-        print("Next steps:")
-        print("1. Verify the new connector is running properly")
-        print("2. Check data integrity in BigQuery")
-        print("3. Monitor for any data type related issues")
-        print("="*80)
+        if failures:
+            sys.stderr.write(f"Failed to migrate: {', '.join(failures)}\n")
+            sys.exit(2)
 
     except APIError as e:
-        print(f"Encountered Error: {e}, Status Code: {e.status_code}, Response: {e.response_text}")
-    except Exception as e:
-        print(f"An error occurred while running the migration tool: {e}")
+        sys.stderr.write(_API_ERR_FMT(e=e, code=e.status_code, body=e.response_text))
+        sys.exit(2)
+    except (OSError, ValueError, EOFError, requests.RequestException) as e:
+        sys.stderr.write(f"An error occurred while running the migration tool: {e}\n")
+        sys.exit(1)
 
 if __name__ == '__main__':
     base_url = "https://confluent.cloud/"
-    last_poll_time = datetime.now()
     main()
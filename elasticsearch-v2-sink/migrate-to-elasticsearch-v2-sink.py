@@ -10,19 +10,74 @@ creates a new V2 connector with preserved offsets.
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 import getpass
+import random
 import sys
 import os
-from datetime import datetime
+import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# orjson parses bytes directly and is several times faster than the stdlib
+# decoder; fall back to stdlib json when it is not installed. Both decoders
+# raise ValueError subclasses on malformed input.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dumps_compact(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+    def _dumps_compact(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 # Constants
 BASE_URL = "https://confluent.cloud/"
 SCRUBBED_PASSWORD_STRING = "****************"
 
+# Single pooled session so every call to the Confluent control plane reuses
+# one keep-alive TCP+TLS connection instead of handshaking per request.
+# Considered and rejected: httpx.Client(http2=True) to multiplex the
+# concurrent GETs over one socket. It would add two dependencies (httpx, h2)
+# to save at most two TLS handshakes per run against an endpoint whose
+# latency is dominated by server time, and urllib3's Retry handling would
+# need reimplementing; requests stays.
+# GETs are idempotent and retry transparently with exponential backoff
+# (honoring Retry-After on 429s). POSTs are excluded: a 5xx reply may mean
+# the connector was created anyway, so replays are handled manually below.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=5, backoff_factor=1.0,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET"],
+                      respect_retry_after_header=True)
+))
+# Advertise compression explicitly in case a middlebox strips the default
+# header. Brotli is only offered when a decoder is importable; advertising
+# "br" without one would leave response bodies undecodable.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+SESSION.headers.update({'Accept': 'application/json',
+                        'Accept-Encoding': _ACCEPT_ENCODING})
+
 # Global variables for authentication state
-auth_token = None
-last_poll_time = datetime.now()
 user_email = None
 user_password = None
 
@@ -39,9 +94,37 @@ class APIError(Exception):
 # Utility Functions
 # ============================================================================
 
+class TokenCache:
+    """Authentication token plus its expiry, refreshed lazily on access.
+
+    Uses time.monotonic() so wall-clock jumps cannot break the TTL check,
+    and refreshes a safety margin before the server-side 180s session
+    expiry so an in-flight request never straddles the boundary.
+    """
+
+    TTL_SECONDS = 180
+    SAFETY_MARGIN_SECONDS = 30
+
+    def __init__(self):
+        self.token = None
+        self.expires_at = 0.0
+
+    def set(self, token):
+        self.token = token
+        self.expires_at = time.monotonic() + self.TTL_SECONDS - self.SAFETY_MARGIN_SECONDS
+
+    def get(self):
+        if self.token is None or time.monotonic() >= self.expires_at:
+            self.set(get_auth_token())
+        return self.token
+
+
+TOKEN_CACHE = TokenCache()
+
+
 def get_auth_token(email=None, password=None):
-    """Get/refresh authentication token."""
-    global auth_token, last_poll_time, user_email, user_password
+    """Authenticate and return a fresh session token."""
+    global user_email, user_password
 
     # Store credentials on first call
     if email and password:
@@ -58,7 +141,7 @@ def get_auth_token(email=None, password=None):
         'password': user_password
     }
 
-    response = requests.post(url, json=json_data)
+    response = SESSION.post(url, json=json_data)
 
     if not response.ok:
         raise APIError(f"Failed to get auth token: {response.status_code} {response.reason}",
@@ -66,32 +149,20 @@ def get_auth_token(email=None, password=None):
                        response_text=response.text)
 
     try:
-        token = response.json().get('token')
+        token = _loads(response.content).get('token')
         if not token:
             raise APIError("Auth token not found in response")
-        auth_token = token
-        last_poll_time = datetime.now()
         return token
-    except json.JSONDecodeError:
+    except ValueError:
         raise APIError("Failed to decode JSON while getting auth token", response_text=response.text)
 
 
-def refresh_token_if_needed():
-    """Refresh auth token if it's been more than 3 minutes since last poll."""
-    global last_poll_time
-
-    if (datetime.now() - last_poll_time).total_seconds() > 180:
-        get_auth_token(user_email, user_password)
-
-
 def get_connector_config(env, lkc, connector_name):
     """Fetch connector configuration."""
-    refresh_token_if_needed()
-
-    cookies = {'auth_token': auth_token}
+    cookies = {'auth_token': TOKEN_CACHE.get()}
     url = f"{BASE_URL}api/accounts/{env}/clusters/{lkc}/connectors/{connector_name}"
 
-    response = requests.get(url, cookies=cookies)
+    response = SESSION.get(url, cookies=cookies)
 
     if not response.ok:
         raise APIError(f"Failed to get connector config for {connector_name}: {response.status_code} {response.reason}",
@@ -99,23 +170,25 @@ def get_connector_config(env, lkc, connector_name):
                        response_text=response.text)
 
     try:
-        json_response = response.json()
+        json_response = _loads(response.content)
         return json_response["config"]
-    except json.JSONDecodeError:
+    except ValueError:
         raise APIError(f"Failed to decode JSON for connector config: {connector_name}", response_text=response.text)
 
 
 def get_connector_offsets(env, lkc, connector_name):
     """Fetch connector offsets."""
-    refresh_token_if_needed()
-
-    cookies = {'auth_token': auth_token}
+    cookies = {'auth_token': TOKEN_CACHE.get()}
     url = f"{BASE_URL}api/accounts/{env}/clusters/{lkc}/connectors/{connector_name}/offsets"
 
-    response = requests.get(url, cookies=cookies)
+    # Offsets payloads grow with partition count, so stream the body and
+    # hand the raw bytes straight to the decoder instead of materializing
+    # an intermediate text copy.
+    response = SESSION.get(url, cookies=cookies, stream=True)
 
     if response.status_code == 404:
         # No offsets yet - connector hasn't committed
+        response.close()
         return []
 
     if not response.ok:
@@ -123,21 +196,34 @@ def get_connector_offsets(env, lkc, connector_name):
                        status_code=response.status_code,
                        response_text=response.text)
 
+    with response:
+        body = response.raw.read(decode_content=True)
+
     try:
-        json_response = response.json()
+        json_response = _loads(body)
         return json_response.get("offsets", [])
-    except json.JSONDecodeError:
-        raise APIError(f"Failed to decode JSON for connector offsets: {connector_name}", response_text=response.text)
+    except ValueError:
+        raise APIError(f"Failed to decode JSON for connector offsets: {connector_name}",
+                       response_text=body.decode("utf-8", "replace"))
+
+
+# Connector state rarely changes within a run; remember it briefly so a
+# repeated check in the same batch does not pay another round-trip.
+_STATUS_CACHE_TTL_SECONDS = 30
+_status_cache = {}
 
 
 def get_connector_status(env, lkc, connector_name):
-    """Fetch connector status."""
-    refresh_token_if_needed()
+    """Fetch connector status, cached for a short TTL per connector."""
+    cache_key = (env, lkc, connector_name)
+    cached = _status_cache.get(cache_key)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
 
-    cookies = {'auth_token': auth_token}
+    cookies = {'auth_token': TOKEN_CACHE.get()}
     url = f"{BASE_URL}api/accounts/{env}/clusters/{lkc}/connectors/{connector_name}/status"
 
-    response = requests.get(url, cookies=cookies)
+    response = SESSION.get(url, cookies=cookies)
 
     if not response.ok:
         raise APIError(f"Failed to get connector status for {connector_name}: {response.status_code} {response.reason}",
@@ -145,17 +231,17 @@ def get_connector_status(env, lkc, connector_name):
                        response_text=response.text)
 
     try:
-        json_response = response.json()
-        return json_response["connector"]["state"]
-    except json.JSONDecodeError:
+        state = _loads(response.content)["connector"]["state"]
+    except ValueError:
         raise APIError(f"Failed to decode JSON for connector status: {connector_name}", response_text=response.text)
 
+    _status_cache[cache_key] = (state, time.monotonic() + _STATUS_CACHE_TTL_SECONDS)
+    return state
+
 
 def send_create_request(env, lkc, connector_name, config, offsets):
     """Create new connector with config and offsets."""
-    refresh_token_if_needed()
-
-    cookies = {'auth_token': auth_token}
+    cookies = {'auth_token': TOKEN_CACHE.get()}
     new_connector_name = config.get("name", connector_name)
 
     json_data = {
@@ -166,11 +252,28 @@ def send_create_request(env, lkc, connector_name, config, offsets):
 
     url = f"{BASE_URL}api/accounts/{env}/clusters/{lkc}/connectors"
 
-    response = requests.post(
-        url,
-        cookies=cookies,
-        json=json_data,
-    )
+    # Serialize the body once up front; retries resend the same bytes
+    # instead of re-encoding the nested config and offsets each attempt.
+    body = _dumps_compact(json_data)
+
+    # Retry only errors where the request never reached the server; a read
+    # timeout or 5xx could mean the connector was created despite the error,
+    # and replaying those would risk a duplicate.
+    for attempt in range(3):
+        try:
+            response = SESSION.post(
+                url,
+                cookies=cookies,
+                data=body,
+                headers={'Content-Type': 'application/json'},
+            )
+            break
+        except requests.ConnectionError as e:
+            if attempt == 2:
+                raise APIError(f"Failed to reach Confluent Cloud while creating connector: {e}")
+            wait = 2 ** attempt + random.random()
+            print(f"Connection error while creating connector, retrying in {wait:.1f}s...")
+            time.sleep(wait)
 
     if response.status_code != 201:
         raise APIError(f"Failed to create connector: {response.status_code} {response.reason}",
@@ -178,10 +281,10 @@ def send_create_request(env, lkc, connector_name, config, offsets):
                        response_text=response.text)
 
     try:
-        json_response = response.json()
-        print(f"Connector '{new_connector_name}' created successfully. Response: {json.dumps(json_response, indent=2)}")
+        json_response = _loads(response.content)
+        print(f"Connector '{new_connector_name}' created successfully. Response: {_dumps(json_response)}")
         return json_response
-    except json.JSONDecodeError:
+    except ValueError:
         raise APIError(f"Failed to decode JSON response for connector creation", response_text=response.text)
 
 
@@ -205,8 +308,8 @@ def get_credentials_input():
             cred_file_path = input("Enter the path to your credentials JSON file: ").strip()
             if cred_file_path and os.path.exists(cred_file_path):
                 try:
-                    with open(cred_file_path, 'r') as f:
-                        cred_data = json.load(f)
+                    with open(cred_file_path, 'rb') as f:
+                        cred_data = _loads(f.read())
 
                     email = cred_data.get('email')
                     password = cred_data.get('password')
@@ -219,7 +322,7 @@ def get_credentials_input():
                         retry = input("Try again? (yes/no): ").strip().lower()
                         if retry not in ['yes', 'y']:
                             return get_credentials_secure_input()
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     print(f"Invalid JSON format in credentials file: {e}")
                     retry = input("Try again? (yes/no): ").strip().lower()
                     if retry not in ['yes', 'y']:
@@ -252,6 +355,52 @@ def get_credentials_input():
             return get_credentials_secure_input()
 
 
+_KEYRING_SERVICE = "confluent-migrate"
+
+
+def _keyring_get_password(email):
+    """Return the stored password for email, or None.
+
+    Only active when USE_KEYRING=1 and the optional keyring package is
+    installed; any keyring backend failure falls back to prompting.
+    """
+    if not email or os.environ.get("USE_KEYRING") != "1":
+        return None
+    try:
+        import keyring
+        return keyring.get_password(_KEYRING_SERVICE, email)
+    except Exception:
+        return None
+
+
+def _keyring_store_password(email, password):
+    """Best-effort save of the password for the next run (USE_KEYRING=1).
+
+    Only called after the password has authenticated successfully, so a
+    typo is never persisted.
+    """
+    if os.environ.get("USE_KEYRING") != "1":
+        return
+    try:
+        import keyring
+        keyring.set_password(_KEYRING_SERVICE, email, password)
+        print("Password stored in OS keyring for future runs")
+    except Exception:
+        pass
+
+
+def _keyring_delete_password(email):
+    """Best-effort removal of a stored password that failed to authenticate."""
+    if not email or os.environ.get("USE_KEYRING") != "1":
+        return
+    try:
+        import keyring
+        keyring.delete_password(_KEYRING_SERVICE, email)
+        print("Removed stale password from OS keyring")
+    except Exception:
+        pass
+
+
 def get_credentials_secure_input():
     """Get credentials through secure user input (password hidden)."""
     print("\nSecure Credentials Input")
@@ -259,6 +408,12 @@ def get_credentials_secure_input():
 
     email = input("Enter your Confluent Cloud email: ").strip()
 
+    # Reuse a password saved by a previous run when keyring is enabled
+    password = _keyring_get_password(email)
+    if password:
+        print("Password loaded from OS keyring")
+        return email, password
+
     # Use getpass for secure password input (hidden)
     password = getpass.getpass("Enter your Confluent Cloud password: ")
 
@@ -303,7 +458,7 @@ def display_config_and_confirm(config, message="Proceed with creating the connec
         if key in display_config:
             display_config[key] = '********'
 
-    print(json.dumps(display_config, indent=4))
+    print(_dumps(display_config))
     print("="*80)
 
     user_input = input(f"\nPlease review the above configuration. {message} (yes/no): ")
@@ -359,6 +514,19 @@ DISCONTINUED = {
     "external.resource.usage": "Split into 'auto.create' + 'resource.type' in V2 (derived automatically during migration).",
 }
 
+# Sentinel distinguishing "key absent" from a legitimate falsy value, so
+# the rename loop needs one dict lookup per key instead of an "in" check
+# followed by a subscript.
+_MISSING = object()
+
+# Keys the transform handles specially (renamed, discontinued, or set from
+# user input / derived values); everything else copies through unchanged.
+# Built once here instead of per transform call.
+EXCLUDED_KEYS = frozenset(RENAMED_MAPPING) | frozenset(DISCONTINUED) | frozenset({
+    "name", "connector.class", "connection.url", "connection.username",
+    "connection.password", "elastic.security.protocol", "external.resource.usage",
+})
+
 # ============================================================================
 # Breaking Changes
 # ============================================================================
@@ -452,13 +620,10 @@ def show_ssl_file_warning(ssl_file_configs):
 
 def check_discontinued_configs(v1_config):
     """Check for configurations that are not supported in V2 connector."""
-    found_discontinued = []
-
-    for config_key in DISCONTINUED.keys():
-        if config_key in v1_config:
-            found_discontinued.append(config_key)
-
-    return found_discontinued
+    # Dict key views intersect in C, replacing the per-key membership loop;
+    # report in DISCONTINUED definition order, not set-iteration order.
+    present = DISCONTINUED.keys() & v1_config.keys()
+    return [key for key in DISCONTINUED if key in present]
 
 
 def show_discontinued_configs_warning(discontinued_configs, v1_config):
@@ -850,26 +1015,21 @@ def transform_v1_to_v2(v1_config, user_inputs, derived):
     # Use connection.url from user_inputs (already validated for single URL)
     v2_config["connection.url"] = user_inputs['connection_url']
 
-    # Apply renamed mappings
+    # Apply renamed mappings (single lookup per key via a missing sentinel)
     for v1_key, v2_key in RENAMED_MAPPING.items():
-        if v1_key in v1_config:
+        value = v1_config.get(v1_key, _MISSING)
+        if value is not _MISSING:
             # topic.to.resource.mapping only applies when auto.create=false
             if v2_key == "topic.to.resource.mapping" and derived['auto_create']:
                 warnings.append(f"Dropping '{v1_key}' because auto.create=true (mapping only applies to pre-created resources)")
             else:
-                v2_config[v2_key] = v1_config[v1_key]
+                v2_config[v2_key] = value
                 warnings.append(f"Renamed config: '{v1_key}' -> '{v2_key}'")
 
     # Copy all V1 configs to V2, except discontinued and specially handled ones
     # This includes: direct configs, SMT transforms, kafka.*, schema.registry.*, etc.
-    excluded_keys = set(
-        list(RENAMED_MAPPING.keys()) + list(DISCONTINUED.keys()) +
-        ["name", "connector.class", "connection.url", "connection.username",
-         "connection.password", "elastic.security.protocol", "external.resource.usage"]
-    )
-
     for key, value in v1_config.items():
-        if key not in excluded_keys and key not in v2_config:
+        if key not in EXCLUDED_KEYS and key not in v2_config:
             v2_config[key] = value
 
     # Handle data.stream.type: V1 default was NONE, V2 default is LOGS
@@ -906,129 +1066,190 @@ def display_transformation_warnings(warnings):
 # Main Migration Flow
 # ============================================================================
 
+def migrate_connector(env, lkc, connector_name):
+    """Run the interactive migration flow for a single connector.
+
+    Assumes authentication is already established. Returns True when the
+    V2 connector was created and False when the operator cancelled; API
+    failures raise APIError for the caller to handle.
+    """
+    print("\n" + "="*80)
+    print(f"Migrating connector: {connector_name}")
+    print("="*80)
+
+    # Steps 3-4: Fetch status, offsets and config. The three GETs are
+    # independent and share the pooled session, so offsets and config
+    # download in the background while the status fetch and its
+    # confirmation prompt run; total latency is the slowest round-trip
+    # instead of the sum.
+    print("\nFetching V1 connector status, offsets and configuration...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        offsets_future = executor.submit(get_connector_offsets, env, lkc, connector_name)
+        config_future = executor.submit(get_connector_config, env, lkc, connector_name)
+
+        status = get_connector_status(env, lkc, connector_name)
+        if not check_connector_status_and_confirm(status, connector_name):
+            return False
+
+        offsets = offsets_future.result()
+        print(f"Retrieved {len(offsets)} offset entries")
+
+        v1_config = config_future.result()
+        print(f"Retrieved {len(v1_config)} configuration properties")
+
+    # Step 5: Check for SSL file configurations
+    print("\nChecking for SSL file configurations...")
+    ssl_file_configs = check_ssl_file_configs(v1_config)
+    if ssl_file_configs:
+        if not show_ssl_file_warning(ssl_file_configs):
+            return False
+
+    # Step 6: Check for discontinued configs
+    print("\nChecking for discontinued configurations...")
+    discontinued_configs = check_discontinued_configs(v1_config)
+    if discontinued_configs:
+        if not show_discontinued_configs_warning(discontinued_configs, v1_config):
+            return False
+
+    # Step 7: Choose migration mode
+    migration_mode = ask_migration_mode()
+
+    # Step 7b: Get test mode configuration if applicable
+    test_config = None
+    if migration_mode == 'test':
+        test_config = get_test_mode_configuration(v1_config)
+
+    # Step 8: Derive V2 properties
+    print("\nDeriving V2 properties from V1 configuration...")
+    derived = derive_v2_properties(v1_config)
+    print(f"  - SSL enabled: {derived['ssl_enabled']}")
+    print(f"  - Auto create: {derived['auto_create']}")
+    print(f"  - Resource type: {derived['resource_type']}")
+
+    # Step 9: Get user inputs for V2 properties
+    user_inputs = get_user_inputs(v1_config, derived, migration_mode)
+
+    # Step 10: Transform V1 -> V2 config
+    print("\nTransforming V1 configuration to V2...")
+    v2_config, warnings = transform_v1_to_v2(v1_config, user_inputs, derived)
+
+    # Step 10b: Apply test mode overrides if applicable
+    if test_config:
+        v2_config, test_warnings = apply_test_mode_overrides(v2_config, test_config)
+        warnings.extend(test_warnings)
+
+    display_transformation_warnings(warnings)
+
+    # Step 11: Prompt for any masked sensitive values
+    v2_config = prompt_for_sensitive_values(
+        v2_config,
+        SCRUBBED_PASSWORD_STRING,
+        skip_keys=["connection.password"]  # Already handled
+    )
+
+    # Step 12: Display final config for confirmation
+    mask_keys = ["connection.password", "api.key.value", "kafka.api.secret",
+                 "schema.registry.basic.auth.user.info"]
+
+    if not display_config_and_confirm(v2_config,
+                                       "Do you want to proceed with creating the V2 connector?",
+                                       mask_keys=mask_keys):
+        print("Migration cancelled.")
+        return False
+
+    # Step 13: Create V2 connector with preserved offsets
+    print("\nCreating V2 connector with preserved offsets...")
+    send_create_request(env, lkc, user_inputs['new_connector_name'], v2_config, offsets)
+
+    # Step 14: Show next steps
+    print("\n" + "="*80)
+    print("MIGRATION COMPLETED SUCCESSFULLY")
+    print("="*80)
+    print("\nNext steps:")
+    print("  1. Verify the new V2 connector is running properly in Confluent Cloud Console")
+    print("  2. Check that data is being written to Elasticsearch correctly")
+    print("  3. Monitor connector metrics for any errors")
+    print("  4. Once verified, you can delete the old V1 connector")
+    print()
+    print("IMPORTANT: The V2 connector starts from the preserved V1 offsets,")
+    print("so no data should be duplicated or lost.")
+    print("="*80)
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Migrate Elasticsearch Sink V1 connector to V2."
     )
-    parser.add_argument('--v1_connector', required=True, help='Name of the V1 connector')
+    parser.add_argument('--v1_connector', required=True,
+                        help='Name of the V1 connector, or a comma-separated list of names')
     parser.add_argument('--environment', required=True, help='Environment ID')
     parser.add_argument('--cluster_id', required=True, help='Cluster ID')
     args = parser.parse_args()
 
-    connector_name = args.v1_connector
+    connector_names = [name.strip() for name in args.v1_connector.split(',') if name.strip()]
     env = args.environment
     lkc = args.cluster_id
 
     try:
-        # Step 1: Show breaking changes warning
+        # Step 1: Show breaking changes warning (once for the whole batch)
         print("\n" + "="*80)
         print("ELASTICSEARCH SINK V1 TO V2 MIGRATION TOOL")
         print("="*80)
-        print(f"Migrating connector: {connector_name}")
+        print(f"Migrating connectors: {', '.join(connector_names)}")
         print(f"Environment: {env}")
         print(f"Cluster: {lkc}")
 
         if not show_breaking_changes_warning():
             return
 
-        # Step 2: Get credentials and authenticate
+        # Step 2: Get credentials and authenticate (once; the token cache
+        # re-authenticates from the stashed credentials as needed)
         print("\nSetting up Confluent Cloud authentication...")
         email, password = get_credentials_input()
-        get_auth_token(email, password)
-
-        # Step 3: Check V1 connector status
-        print("\nFetching V1 connector status...")
-        status = get_connector_status(env, lkc, connector_name)
-
-        if not check_connector_status_and_confirm(status, connector_name):
-            return
-
-        # Step 4: Fetch V1 config and offsets
-        print("\nFetching V1 connector offsets...")
-        offsets = get_connector_offsets(env, lkc, connector_name)
-        print(f"Retrieved {len(offsets)} offset entries")
-
-        print("Fetching V1 connector configuration...")
-        v1_config = get_connector_config(env, lkc, connector_name)
-        print(f"Retrieved {len(v1_config)} configuration properties")
-
-        # Step 5: Check for SSL file configurations
-        print("\nChecking for SSL file configurations...")
-        ssl_file_configs = check_ssl_file_configs(v1_config)
-        if ssl_file_configs:
-            if not show_ssl_file_warning(ssl_file_configs):
-                return
-
-        # Step 6: Check for discontinued configs
-        print("\nChecking for discontinued configurations...")
-        discontinued_configs = check_discontinued_configs(v1_config)
-        if discontinued_configs:
-            if not show_discontinued_configs_warning(discontinued_configs, v1_config):
-                return
-
-        # Step 7: Choose migration mode
-        migration_mode = ask_migration_mode()
-
-        # Step 7b: Get test mode configuration if applicable
-        test_config = None
-        if migration_mode == 'test':
-            test_config = get_test_mode_configuration(v1_config)
-
-        # Step 8: Derive V2 properties
-        print("\nDeriving V2 properties from V1 configuration...")
-        derived = derive_v2_properties(v1_config)
-        print(f"  - SSL enabled: {derived['ssl_enabled']}")
-        print(f"  - Auto create: {derived['auto_create']}")
-        print(f"  - Resource type: {derived['resource_type']}")
-
-        # Step 9: Get user inputs for V2 properties
-        user_inputs = get_user_inputs(v1_config, derived, migration_mode)
-
-        # Step 10: Transform V1 -> V2 config
-        print("\nTransforming V1 configuration to V2...")
-        v2_config, warnings = transform_v1_to_v2(v1_config, user_inputs, derived)
-
-        # Step 10b: Apply test mode overrides if applicable
-        if test_config:
-            v2_config, test_warnings = apply_test_mode_overrides(v2_config, test_config)
-            warnings.extend(test_warnings)
-
-        display_transformation_warnings(warnings)
-
-        # Step 11: Prompt for any masked sensitive values
-        v2_config = prompt_for_sensitive_values(
-            v2_config,
-            SCRUBBED_PASSWORD_STRING,
-            skip_keys=["connection.password"]  # Already handled
-        )
-
-        # Step 12: Display final config for confirmation
-        mask_keys = ["connection.password", "api.key.value", "kafka.api.secret",
-                     "schema.registry.basic.auth.user.info"]
-
-        if not display_config_and_confirm(v2_config,
-                                           "Do you want to proceed with creating the V2 connector?",
-                                           mask_keys=mask_keys):
-            print("Migration cancelled.")
-            return
-
-        # Step 13: Create V2 connector with preserved offsets
-        print("\nCreating V2 connector with preserved offsets...")
-        send_create_request(env, lkc, user_inputs['new_connector_name'], v2_config, offsets)
-
-        # Step 14: Show next steps
-        print("\n" + "="*80)
-        print("MIGRATION COMPLETED SUCCESSFULLY")
-        print("="*80)
-        print("\nNext steps:")
-        print("  1. Verify the new V2 connector is running properly in Confluent Cloud Console")
-        print("  2. Check that data is being written to Elasticsearch correctly")
-        print("  3. Monitor connector metrics for any errors")
-        print("  4. Once verified, you can delete the old V1 connector")
-        print()
-        print("IMPORTANT: The V2 connector starts from the preserved V1 offsets,")
-        print("so no data should be duplicated or lost.")
-        print("="*80)
+        try:
+            TOKEN_CACHE.set(get_auth_token(email, password))
+        except APIError as e:
+            # Drop a stale keyring entry so the next run falls back to the
+            # prompt instead of retrying the same rejected password.
+            if e.status_code == 401:
+                _keyring_delete_password(email)
+            raise
+        # Persist only credentials that just authenticated successfully
+        _keyring_store_password(email, password)
+
+        # Steps 3-14 per connector, reusing the session and token across
+        # the batch. With several connectors an API failure on one does not
+        # abort the rest; a summary reports any failures at the end.
+        failed = []
+        cancelled = []
+        for connector_name in connector_names:
+            if len(connector_names) == 1:
+                migrate_connector(env, lkc, connector_name)
+                continue
+            try:
+                if not migrate_connector(env, lkc, connector_name):
+                    cancelled.append(connector_name)
+            except APIError as e:
+                print(f"\nAPI Error while migrating '{connector_name}': {e}")
+                if e.status_code:
+                    print(f"Status Code: {e.status_code}")
+                if e.response_text:
+                    print(f"Response: {e.response_text}")
+                failed.append(connector_name)
+
+        if len(connector_names) > 1:
+            migrated = len(connector_names) - len(failed) - len(cancelled)
+            print("\n" + "="*80)
+            print(f"BATCH SUMMARY: {migrated} of "
+                  f"{len(connector_names)} connectors migrated successfully")
+            if cancelled:
+                print(f"Cancelled: {', '.join(cancelled)}")
+            if failed:
+                print(f"Failed: {', '.join(failed)}")
+            print("="*80)
+            if failed:
+                sys.exit(1)
 
     except APIError as e:
         print(f"\nAPI Error: {e}")